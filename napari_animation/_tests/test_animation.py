@@ -1,4 +1,6 @@
-from unittest.mock import patch
+import pickle
+from dataclasses import replace
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
@@ -69,6 +71,25 @@ def test_get_viewer_state(empty_animation):
     assert isinstance(state, ViewerState)
 
 
+def test_pickle_viewer_state(viewer_state):
+    """Test that ViewerState pickles its fields only."""
+    # populate a cached property, which is not pickled
+    assert viewer_state._digest is not None
+
+    restored = pickle.loads(pickle.dumps(viewer_state))
+    assert restored == viewer_state
+    assert "_digest" not in vars(restored)
+    assert restored._digest == viewer_state._digest
+
+
+def test_unpickle_viewer_state_dict(viewer_state):
+    """Test that ViewerState restores a state pickled as its instance dict."""
+    restored = ViewerState.__new__(ViewerState)
+    restored.__setstate__(dict(vars(viewer_state), _digest="stale"))
+    assert restored == viewer_state
+    assert "_digest" not in vars(restored)
+
+
 def test_set_viewer_state(animation_with_key_frames, viewer_state):
     """Test Animation._set_viewer_state()"""
     animation: Animation = animation_with_key_frames
@@ -83,6 +104,36 @@ def test_set_viewer_state(animation_with_key_frames, viewer_state):
         assert animation_camera_state[key] == current_state.camera[key]
 
 
+def test_apply_viewer_state_changes_only(viewer_state):
+    """Test that only camera and dims values differing from the viewer are
+    set, whatever the previous state."""
+    zoom = viewer_state.camera["zoom"] * 2
+    state = replace(viewer_state, camera={**viewer_state.camera, "zoom": zoom})
+    viewer = MagicMock(layers=[])
+    viewer.camera.dict.return_value = viewer_state.camera
+    viewer.dims.dict.return_value = viewer_state.dims
+    state.apply(viewer, previous_state=state)
+    viewer.camera.update.assert_called_once_with({"zoom": zoom})
+    viewer.dims.update.assert_not_called()
+
+
+def test_apply_viewer_state_known_layer_attributes():
+    """Test that changed layer attributes are set without reading the layer
+    state when the previous state is known."""
+    layer = MagicMock()
+    layer.name = "points"
+    viewer = MagicMock(layers=[layer])
+    previous_state = ViewerState(
+        camera={}, dims={}, layers={"points": {"opacity": 1.0, "size": 3}}
+    )
+    state = ViewerState(
+        camera={}, dims={}, layers={"points": {"opacity": 0.5, "size": 3}}
+    )
+    state.apply(viewer, previous_state=previous_state)
+    assert layer.opacity == 0.5
+    layer.as_layer_data_tuple.assert_not_called()
+
+
 def test_thumbnail_generation(empty_animation):
     """Test thumbnail generation"""
     animation = empty_animation
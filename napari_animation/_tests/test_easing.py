@@ -1,7 +1,15 @@
 import numpy as np
 import pytest
 
-from napari_animation.easing import Easing
+from napari_animation.easing import (
+    Easing,
+    eased_fractions,
+    elastic_ease_in,
+    elastic_ease_in_out,
+    elastic_ease_out,
+    sine_ease_in,
+    sine_ease_out,
+)
 
 
 @pytest.mark.parametrize(
@@ -15,3 +23,35 @@ def test_limits(easing_func):
     tolerance = 1e-7
     assert np.min(result) >= 0 - tolerance
     assert np.max(result) <= 1 + tolerance
+
+
+@pytest.mark.parametrize("easing", list(Easing))
+@pytest.mark.parametrize("steps", [1, 2, 15])
+def test_eased_fractions(easing, steps):
+    """Check that batch easing matches calling the easing function per step"""
+    result = eased_fractions(easing, steps)
+    expected = [easing(s / steps) for s in range(steps)]
+    assert result.shape == (steps,)
+    np.testing.assert_allclose(result, expected, atol=1e-12)
+
+
+@pytest.mark.parametrize("easing", list(Easing))
+def test_easing_func(easing):
+    """Check that the raw easing function matches the enum member"""
+    assert easing.func(0.3) == easing(0.3)
+
+
+@pytest.mark.parametrize(
+    "easing_func",
+    [
+        sine_ease_in,
+        sine_ease_out,
+        elastic_ease_in,
+        elastic_ease_out,
+        elastic_ease_in_out,
+    ],
+)
+def test_end_points(easing_func):
+    """Check that easing functions map 0 to 0 and 1 to 1"""
+    assert np.isclose(easing_func(0), 0)
+    assert np.isclose(easing_func(1), 1)
@@ -1,9 +1,12 @@
+import pickle
+from dataclasses import replace
 from unittest.mock import patch
 
 import numpy as np
 import pytest
 
-from napari_animation.frame_sequence import FrameSequence
+from napari_animation import ViewerState
+from napari_animation.frame_sequence import FrameSequence, LRUDict
 
 
 def test_frame_seq(frame_sequence: FrameSequence):
@@ -20,12 +23,42 @@ def test_frame_seq(frame_sequence: FrameSequence):
         frame_sequence[1000]
 
 
+def test_lru_dict():
+    cache = LRUDict(cache_size=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache["a"] == 1
+    # "b" is the least recently used
+    cache["c"] = 3
+    assert list(cache) == ["a", "c"]
+
+    unbounded = LRUDict()
+    for i in range(100):
+        unbounded[i] = i
+    assert len(unbounded) == 100
+
+
+def test_keyframe_index(frame_sequence: FrameSequence):
+    """Test the map of frame number -> (kf0, kf1, fraction)."""
+    kf0, kf1 = frame_sequence._key_frames
+    index = frame_sequence._keyframe_index
+    assert len(index) == 16
+    assert index[0] == (kf0, kf1, 0)
+    assert index[5] == (kf0, kf1, pytest.approx(5 / 15))
+    assert index[15] == (kf1, kf1, 0)
+    assert 16 not in index
+    assert -1 not in index
+
+    assert index.key_frame_start(0) == 0
+    assert index.key_frame_start(1) == 15
+
+
 def test_frame_seq_caching(frame_sequence: FrameSequence):
     """Test that we only interpolate on demand, and cache results."""
     fs = frame_sequence
     # index into the sequence and watch whether interpolate is called
     with patch(
-        "napari_animation.frame_sequence.interpolate_viewer_state",
+        "napari_animation.frame_sequence.ViewerStateInterpolator",
     ) as mock:
         _ = fs[5]
 
@@ -36,13 +69,61 @@ def test_frame_seq_caching(frame_sequence: FrameSequence):
 
     # indexing the same frame again will not require re-interpolation
     with patch(
-        "napari_animation.frame_sequence.interpolate_viewer_state"
+        "napari_animation.frame_sequence.ViewerStateInterpolator"
     ) as mock:
         _ = fs[5]
         mock.assert_not_called()
 
+    assert len(fs._interpolators) == 1
+
     fs._rebuild_keyframe_index()
     assert len(fs._cache) == 0
+    assert len(fs._interpolators) == 0
+
+
+def test_frame_seq_state_memo(frame_sequence: FrameSequence):
+    """Test that interpolated states are memoized across index rebuilds."""
+    fs = frame_sequence
+    state = fs[5]
+    fs._rebuild_keyframe_index()
+
+    # the transition is unchanged, so the state need not be interpolated
+    with patch(
+        "napari_animation.frame_sequence.ViewerStateInterpolator"
+    ) as mock:
+        assert fs[5] is state
+        mock.assert_not_called()
+
+    # replacing a keyframe by an identical one keeps the memoized states
+    key_frame = fs._key_frames[1]
+    fs._key_frames[1] = replace(
+        key_frame,
+        viewer_state=pickle.loads(pickle.dumps(key_frame.viewer_state)),
+    )
+    with patch(
+        "napari_animation.frame_sequence.ViewerStateInterpolator"
+    ) as mock:
+        assert fs[5] is state
+        mock.assert_not_called()
+
+    # states interpolated from removed keyframes are dropped
+    fs._key_frames.remove(fs._key_frames[-1])
+    assert len(fs._state_memo) == 0
+
+
+def test_frame_seq_batch_interpolation(frame_sequence: FrameSequence):
+    """Test that the next frames of a transition are interpolated together."""
+    fs = frame_sequence
+    states = [fs[i] for i in range(2)]
+    with patch(
+        "napari_animation.frame_sequence.ViewerStateInterpolator"
+    ) as mock:
+        states += [fs[i] for i in range(2, len(fs))]
+        mock.assert_not_called()
+
+    zoom = states[0].camera["zoom"]
+    for i, state in enumerate(states):
+        assert state.camera["zoom"] == pytest.approx(zoom * 2 ** (i / 15))
 
 
 def test_iterframes(animation_with_key_frames, frame_sequence: FrameSequence):
@@ -53,6 +134,7 @@ def test_iterframes(animation_with_key_frames, frame_sequence: FrameSequence):
 
     for n, i in enumerate(fs.iter_frames(viewer)):
         assert isinstance(i, np.ndarray)
+        assert i.flags.writeable
         _shape = i.shape
         assert _shape[-1] == 4
         if n > 4:
@@ -62,5 +144,42 @@ def test_iterframes(animation_with_key_frames, frame_sequence: FrameSequence):
         assert isinstance(i, np.ndarray)
         assert i.shape[:2] == (_shape[0] // 2, _shape[1] // 2)
         assert i.dtype == np.uint8
+        assert i.flags.writeable
         if n > 4:
             break
+
+
+def test_iterframes_hold(empty_animation):
+    """Test that a transition between identical keyframes is rendered once."""
+    animation = empty_animation
+    animation.capture_keyframe()
+    animation.capture_keyframe(steps=10)
+    fs = animation._frames
+
+    assert all(fs[i] is fs[0] for i in range(10))
+
+    frame = np.zeros((8, 8, 4), dtype=np.uint8)
+    with patch.object(ViewerState, "render", return_value=frame) as render:
+        frames = list(fs.iter_frames(animation.viewer))
+
+    assert len(frames) == 11
+    # one render for the held state and one for the final keyframe
+    assert render.call_count == 2
+
+
+def test_iterframes_layer_state(image_animation):
+    """Test that layer attributes are applied to every rendered frame."""
+    animation = image_animation
+    layer = animation.viewer.layers[-1]
+    animation.capture_keyframe()
+    layer.opacity = 0.2
+    layer.visible = False
+    animation.capture_keyframe(steps=4)
+    layer.opacity = 0.8
+    layer.visible = True
+    fs = animation._frames
+
+    for index, _ in enumerate(fs.iter_frames(animation.viewer)):
+        layer_state = fs[index].layers[layer.name]
+        assert layer.opacity == pytest.approx(layer_state["opacity"])
+        assert layer.visible == layer_state["visible"]
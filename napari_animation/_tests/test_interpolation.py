@@ -4,13 +4,23 @@ from typing import NamedTuple
 
 import numpy as np
 import pytest
+from scipy.spatial.transform import Rotation as R
 
-from napari_animation.interpolation import interpolate_viewer_state
+from napari_animation import ViewerState
+from napari_animation.interpolation import (
+    Interpolation,
+    ViewerStateInterpolator,
+    interpolate_viewer_state,
+)
 from napari_animation.interpolation.base_interpolation import (
+    _euler_to_quaternion,
+    _quaternion_to_euler,
     interpolate_bool,
     interpolate_log,
     interpolate_num,
     interpolate_sequence,
+    slerp,
+    slerp_batch,
 )
 from napari_animation.interpolation.utils import nested_assert_close
 
@@ -104,3 +114,159 @@ def test_interpolate_namedtuple(fraction, expected):
     result = interpolate_sequence(initial_state, final_state, fraction)
     assert isinstance(result, NTuple)
     assert result == expected
+
+
+def _make_state(value, visible):
+    return ViewerState(
+        camera={
+            "center": (0.0, float(value), value * 2.0),
+            "zoom": 1.0 + value,
+        },
+        dims={
+            "current_step": (0, 10 * value),
+            "ndisplay": 2,
+            "range": (NTuple(0.0, 0), NTuple(float(value), 2 * value)),
+        },
+        layers={
+            "points": {
+                "opacity": value / 10,
+                "visible": visible,
+                "blending": "translucent",
+                "size": np.float32(value),
+            }
+        },
+    )
+
+
+@pytest.mark.parametrize("fraction", [0, 0.25, 0.5, 1])
+def test_viewer_state_interpolator(fraction):
+    """Check that interpolated states preserve value types"""
+    initial_state = _make_state(0, True)
+    final_state = _make_state(10, False)
+    interpolator = ViewerStateInterpolator(
+        initial_state, final_state, {"camera.zoom": Interpolation.LOG}
+    )
+    result = interpolator(fraction)
+    assert isinstance(result, ViewerState)
+    assert result.camera["center"] == (0.0, 10 * fraction, 20 * fraction)
+    assert isinstance(result.camera["center"], tuple)
+    assert np.isclose(result.camera["zoom"], 11**fraction)
+    assert result.dims["current_step"] == (0, int(100 * fraction))
+    assert all(isinstance(v, int) for v in result.dims["current_step"])
+    assert result.dims["ndisplay"] == 2
+    assert result.dims["range"] == (
+        NTuple(0.0, 0),
+        NTuple(10.0 * fraction, int(20 * fraction)),
+    )
+    assert all(isinstance(r, NTuple) for r in result.dims["range"])
+    layer = result.layers["points"]
+    assert layer["opacity"] == fraction
+    assert layer["visible"] is (fraction == 0)
+    assert layer["blending"] == "translucent"
+    assert isinstance(layer["size"], np.float32)
+
+
+def test_viewer_state_interpolator_many():
+    """Check that batch interpolation matches interpolating frame by frame"""
+    interpolator = ViewerStateInterpolator(
+        _make_state(0, True), _make_state(10, False)
+    )
+    fractions = np.linspace(0, 1, 7)
+    states = interpolator.interpolate_many(fractions)
+    assert len(states) == len(fractions)
+    for state, fraction in zip(states, fractions):
+        nested_assert_close(asdict(state), asdict(interpolator(fraction)))
+
+
+def test_viewer_state_interpolator_endpoints():
+    """Check that the states themselves are returned at fractions 0 and 1"""
+    initial_state = _make_state(0, True)
+    final_state = _make_state(10, False)
+    interpolator = ViewerStateInterpolator(initial_state, final_state)
+    states = interpolator.interpolate_many([0.0, 0.5, 1.0])
+    assert states[0] is initial_state
+    assert states[1] not in (initial_state, final_state)
+    assert states[2] is final_state
+
+
+def test_viewer_state_interpolator_static_leaves():
+    """Check that leaves equal in both states are kept as they are"""
+    initial_state = _make_state(0, True)
+    final_state = _make_state(10, True)
+    interpolator = ViewerStateInterpolator(initial_state, final_state)
+    # visible and blending are the same in both states
+    assert interpolator._switches == []
+    for state in interpolator.interpolate_many([0, 0.5, 1]):
+        layer = state.layers["points"]
+        assert layer["visible"] is True
+        assert layer["blending"] == "translucent"
+        assert state.dims["ndisplay"] == 2
+
+
+def test_viewer_state_interpolator_static_angles():
+    """Check that equal camera angles are kept as they are with SLERP"""
+    initial_state = _make_state(0, True)
+    final_state = _make_state(10, True)
+    for state in (initial_state, final_state):
+        state.camera["angles"] = (0.0, 0.0, 90.0)
+    interpolator = ViewerStateInterpolator(
+        initial_state, final_state, {"camera.angles": Interpolation.SLERP}
+    )
+    assert interpolator._slerps == []
+    assert interpolator(0.5).camera["angles"] == (0.0, 0.0, 90.0)
+
+
+@pytest.mark.parametrize(
+    "a,b",
+    [
+        ((0.0, 0.0, 90.0), (10.0, 20.0, 30.0)),
+        ((0.0, 0.0, 0.0), (90.0, 45.0, 0.0)),
+        ((150.0, 10.0, -150.0), (-150.0, -10.0, 150.0)),
+    ],
+)
+def test_slerp_batch(a, b):
+    """Check that batch slerp matches slerp at each fraction"""
+    fractions = np.linspace(0, 1, 11)
+    result = slerp_batch(a, b, fractions)
+    assert result.shape == (len(fractions), 3)
+    expected = [slerp(a, b, fraction) for fraction in fractions]
+    difference = R.from_euler(
+        "ZYX", result, degrees=True
+    ).inv() * R.from_euler("ZYX", expected, degrees=True)
+    assert np.all(difference.magnitude() < 1e-4)
+
+
+@pytest.mark.parametrize(
+    "angles",
+    [(10.0, 20.0, 30.0), (-170.0, 5.0, 120.0), (30.0, 90.0, 0.0)],
+)
+def test_euler_to_quaternion(angles):
+    """Check that Euler angles are converted to quaternions like scipy"""
+    np.testing.assert_allclose(
+        _euler_to_quaternion(*angles),
+        R.from_euler("ZYX", angles, degrees=True).as_quat(),
+        atol=1e-12,
+    )
+
+
+@pytest.mark.parametrize(
+    "angles",
+    [(10.0, 20.0, 30.0), (-170.0, 5.0, 120.0), (30.0, 90.0, 0.0)],
+)
+@pytest.mark.parametrize("scale", [1, -2])
+@pytest.mark.filterwarnings("ignore:Gimbal lock")
+def test_quaternion_to_euler(angles, scale):
+    """Check that quaternions are converted to Euler angles like scipy"""
+    quaternion = R.from_euler("ZYX", angles, degrees=True).as_quat()
+    result = _quaternion_to_euler(*(scale * quaternion))
+    np.testing.assert_allclose(
+        result, R.from_quat(quaternion).as_euler("ZYX", degrees=True)
+    )
+
+
+def test_slerp_fractions_array():
+    """Check that SLERP interpolates arrays of fractions in one batch"""
+    a, b = (0.0, 0.0, 90.0), (10.0, 20.0, 30.0)
+    fractions = np.linspace(0, 1, 5)
+    result = Interpolation.SLERP(a, b, fractions)
+    np.testing.assert_allclose(result, slerp_batch(a, b, fractions))
@@ -1,6 +1,17 @@
+import numpy as np
 import pytest
 
-from ..interpolation.utils import keys_to_list, nested_get
+from ..interpolation.utils import (
+    keys_to_list,
+    leaves,
+    nested_get,
+    nested_seq_assert_close,
+)
+from ..utils import (
+    layer_attribute_changed,
+    resize_frame,
+    write_frames,
+)
 
 input_dict = [{"a": 1, "b": {"c": "d"}}]
 keys = [["b", "c"]]
@@ -25,3 +36,78 @@ def test_keys_to_list(input_dict, expected):
     for keys in result:
         assert isinstance(keys, list)
     assert result == expected
+
+
+def test_leaves():
+    result = list(leaves({"a": 1, "b": {"c": "d"}, "e": {}}))
+    assert result == [(["a"], 1), (["b", "c"], "d"), (["e"], {})]
+
+
+def test_nested_seq_assert_close():
+    nested_seq_assert_close((1.0, [2, ("a", 3.0)]), [1.0, (2.0, ["a", 3.0])])
+    with pytest.raises(AssertionError):
+        nested_seq_assert_close((1.0, [2, 3.0]), (1.0, [2, 3.5]))
+    with pytest.raises(AssertionError):
+        nested_seq_assert_close((1.0, ["a"]), (1.0, ["b"]))
+
+
+@pytest.mark.parametrize(
+    "value,original_value,changed",
+    [
+        (1.0, 1.0, False),
+        (1.0, 2.0, True),
+        (1, 1.0, False),
+        ("a", "a", False),
+        ("a", "b", True),
+        (None, None, False),
+        (float("nan"), float("nan"), True),
+        ((1.0, 2.0), (1.0, 2.0), False),
+        ((1.0, 2.0), (1, 2), False),
+        ([1.0, 2.0], [1.0, 3.0], True),
+        ((1.0, 2.0), (1.0, 2.0, 3.0), True),
+        (np.ones(3), np.ones(3), False),
+        (np.ones(3), np.zeros(3), True),
+        (np.ones((1000, 100)), np.ones((1000, 100)), False),
+        (np.ones((1000, 100)), np.eye(1000, 100), True),
+        ({"a": np.ones(2)}, {"a": np.ones(2)}, False),
+        ({"a": 1}, {"b": 1}, True),
+    ],
+)
+def test_layer_attribute_changed(value, original_value, changed):
+    assert layer_attribute_changed(value, original_value) is changed
+
+
+def test_write_frames():
+    written = []
+    progress = []
+    write_frames(
+        range(10),
+        lambda i, frame: written.append((i, frame)),
+        on_written=lambda: progress.append(len(written)),
+    )
+    assert written == [(i, i) for i in range(10)]
+    assert len(progress) == 10
+
+
+def test_write_frames_error():
+    def write(frame_index, frame):
+        if frame_index == 3:
+            raise OSError("disk full")
+
+    produced = []
+    with pytest.raises(OSError, match="disk full"):
+        write_frames((produced.append(i) or i for i in range(100)), write)
+    # production stops soon after the writer failed
+    assert len(produced) < 100
+
+
+@pytest.mark.parametrize("scale_factor", [0.5, 0.3, 2])
+def test_resize_frame(scale_factor):
+    from scipy import ndimage as ndi
+
+    frame = np.full((21, 30, 4), 200, dtype=np.uint8)
+    resized = resize_frame(frame, scale_factor)
+    expected_shape = ndi.zoom(frame, (scale_factor, scale_factor, 1)).shape
+    assert resized.shape == expected_shape
+    assert resized.dtype == np.uint8
+    np.testing.assert_array_equal(resized, 200)
@@ -12,6 +12,7 @@ from napari_animation.easing import Easing
 
 from .frame_sequence import FrameSequence
 from .key_frame import KeyFrame, KeyFrameList
+from .utils import write_frames
 
 try:
     from importlib.metadata import version
@@ -26,6 +27,9 @@ except ImportError:
 
 napari_version = version("napari")
 
+# extensions written with imageio-ffmpeg
+_FFMPEG_EXTENSIONS = (".mov", ".avi", ".mpg", ".mpeg", ".mp4", ".mkv", ".wmv")
+
 
 class Animation:
     """Make animations using the napari viewer.
@@ -189,15 +193,7 @@ class Animation:
                 duration = 1000 / fps
                 # create imageio writer. Handle separately imageio-ffmpeg extensions and
                 # gif extension which doesn't accept the quality parameter.
-                if file_path.suffix in [
-                    ".mov",
-                    ".avi",
-                    ".mpg",
-                    ".mpeg",
-                    ".mp4",
-                    ".mkv",
-                    ".wmv",
-                ]:
+                if file_path.suffix in _FFMPEG_EXTENSIONS:
                     writer = imageio.get_writer(
                         filename,
                         fps=fps,
@@ -230,30 +226,66 @@ class Animation:
         )
         n_frames = len(self._frames)
 
-        # Render frames (with a progress bar)
+        # Render frames (with a progress bar), frames are written in a
+        # background thread while the next ones are rendered
         print("Rendering frames...")
         sleep(0.05)
-        with tqdm(total=n_frames) as pbar:
-            for frame_index, image in enumerate(frame_generator):
-                if save_as_folder is True:
+        # only check the display every 0.5% of the frames, updates come once
+        # each frame is written and must not pace the rendering
+        with tqdm(
+            total=n_frames, mininterval=0.2, miniters=max(1, n_frames // 200)
+        ) as pbar:
+            if save_as_folder is True:
+
+                def write(frame_index, image):
                     frame_filename = (
                         folder_path / f"{file_path.stem}_{frame_index:06d}.png"
                     )
                     imsave(frame_filename, image)
-                else:
+
+                # PNG files are independent, they can be written in any order
+                # and encoding them releases the GIL, so use a thread per core
+                n_workers = os.cpu_count() or 1
+                write_frames(
+                    frame_generator,
+                    write,
+                    max_workers=n_workers,
+                    max_pending=2 * n_workers,
+                    on_written=pbar.update,
+                )
+            else:
+
+                # ffmpeg drops the alpha channel when encoding, piping raw
+                # rgb24 rather than rgba frames saves a quarter of the data
+                rgb_only = file_path.suffix in _FFMPEG_EXTENSIONS
+                # frames are written one at a time and copied to the ffmpeg
+                # pipe by append_data, so the rgb copy reuses a single buffer
+                rgb_buffer = None
+
+                def write(frame_index, image):
+                    nonlocal rgb_buffer
+                    if (
+                        rgb_only
+                        and np.ndim(image) == 3
+                        and image.shape[2] == 4
+                    ):
+                        shape = (*image.shape[:2], 3)
+                        if rgb_buffer is None or rgb_buffer.shape != shape:
+                            rgb_buffer = np.empty(shape, dtype=image.dtype)
+                        np.copyto(rgb_buffer, image[..., :3])
+                        image = rgb_buffer
                     writer.append_data(image)
-                pbar.update(1)
-        if not save_as_folder:
-            writer.close()
+
+                try:
+                    write_frames(
+                        frame_generator, write, on_written=pbar.update
+                    )
+                finally:
+                    writer.close()
 
     def _keyframe_frame_index(self, keyframe_index):
         """Gets the frame index of the keyframe corresponding to keyframe_index."""
-        # Get all steps leading to keyframe.
-        steps_to_keyframe = [
-            kf.steps for kf in self.key_frames[1 : keyframe_index + 1]
-        ]
-        frame_index = np.sum(steps_to_keyframe) if steps_to_keyframe else 0
-        return int(frame_index)
+        return self._frames._keyframe_index.key_frame_start(keyframe_index)
 
     def _on_keyframe_removed(self, event):
         self.key_frames.selection.active = None
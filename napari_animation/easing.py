@@ -10,7 +10,9 @@ from enum import Enum
 from functools import partial
 from math import cos, pi, pow, sin, sqrt
 
-tau = pi * 2
+import numpy as np
+
+half_pi = pi / 2
 
 
 def linear_interpolation(p):
@@ -87,12 +89,12 @@ def quintic_ease_in_out(p):
 
 def sine_ease_in(p):
     """Modeled after quarter-cycle of sine wave"""
-    return sin((p - 1) * tau) + 1
+    return sin((p - 1) * half_pi) + 1
 
 
 def sine_ease_out(p):
     """Modeled after quarter-cycle of sine wave (different phase)"""
-    return sin(p * tau)
+    return sin(p * half_pi)
 
 
 def sine_ease_in_out(p):
@@ -153,12 +155,12 @@ def exponential_ease_in_out(p):
 
 def elastic_ease_in(p):
     """Modeled after the damped sine wave y = sin(13pi/2*x)*2^(10 * (x - 1))"""
-    return sin(13 * tau * p) * pow(2, 10 * (p - 1))
+    return sin(13 * half_pi * p) * pow(2, 10 * (p - 1))
 
 
 def elastic_ease_out(p):
     """Modeled after the damped sine wave y = sin(-13pi/2*(x + 1))*pow(2, -10x) + 1"""
-    return sin(-13 * tau * (p + 1)) * pow(2, -10 * p) + 1
+    return sin(-13 * half_pi * (p + 1)) * pow(2, -10 * p) + 1
 
 
 def elastic_ease_in_out(p):
@@ -167,10 +169,11 @@ def elastic_ease_in_out(p):
     y = (1/2)*(sin(-13pi/2*((2x-1)+1))*pow(2,-10(2*x-1)) + 2) ; [0.5, 1]
     """
     if p < 0.5:
-        return 0.5 * sin(13 * tau * (2 * p)) * pow(2, 10 * ((2 * p) - 1))
+        return 0.5 * sin(13 * half_pi * (2 * p)) * pow(2, 10 * ((2 * p) - 1))
     else:
         return 0.5 * (
-            sin(-13 * tau * ((2 * p - 1) + 1)) * pow(2, -10 * (2 * p - 1)) + 2
+            sin(-13 * half_pi * ((2 * p - 1) + 1)) * pow(2, -10 * (2 * p - 1))
+            + 2
         )
 
 
@@ -279,3 +282,146 @@ class Easing(Enum):
 
     def __call__(self, *args):
         return self.value(*args)
+
+    @property
+    def func(self):
+        """The easing function itself, to call it without enum dispatch."""
+        return self.value.func
+
+
+def _piecewise(p, lower, upper):
+    """Evaluate `lower` on p < 0.5 and `upper` on p >= 0.5"""
+    out = np.empty_like(p)
+    mask = p < 0.5
+    out[mask] = lower(p[mask])
+    out[~mask] = upper(p[~mask])
+    return out
+
+
+def _quadratic_ease_in_out_array(p):
+    return _piecewise(
+        p, lambda x: 2 * x * x, lambda x: (-2 * x * x) + (4 * x) - 1
+    )
+
+
+def _cubic_ease_in_out_array(p):
+    return _piecewise(
+        p, lambda x: 4 * x * x * x, lambda x: 0.5 * (2 * x - 2) ** 3 + 1
+    )
+
+
+def _quintic_ease_in_out_array(p):
+    return _piecewise(
+        p, lambda x: 16 * x**5, lambda x: 0.5 * (2 * x - 2) ** 5 + 1
+    )
+
+
+def _sine_ease_in_out_array(p):
+    return 0.5 * (1 - np.cos(p * pi))
+
+
+def _circular_ease_in_out_array(p):
+    return _piecewise(
+        p,
+        lambda x: 0.5 * (1 - np.sqrt(1 - 4 * (x * x))),
+        lambda x: 0.5 * (np.sqrt(-((2 * x) - 3) * ((2 * x) - 1)) + 1),
+    )
+
+
+def _exponential_ease_in_out_array(p):
+    out = _piecewise(
+        p,
+        lambda x: 0.5 * 2 ** ((20 * x) - 10),
+        lambda x: -0.5 * 2 ** ((-20 * x) + 10) + 1,
+    )
+    # the end points are exact
+    return np.where((p == 0.0) | (p == 1.0), p, out)
+
+
+def _elastic_ease_in_out_array(p):
+    def lower(x):
+        return 0.5 * np.sin(13 * half_pi * (2 * x)) * 2 ** (10 * ((2 * x) - 1))
+
+    def upper(x):
+        damping = 2 ** (-10 * (2 * x - 1))
+        return 0.5 * (np.sin(-13 * half_pi * ((2 * x - 1) + 1)) * damping + 2)
+
+    return _piecewise(p, lower, upper)
+
+
+def _back_ease_in_out_array(p):
+    def lower(x):
+        f = 2 * x
+        return 0.5 * (f * f * f - f * np.sin(f * pi))
+
+    def upper(x):
+        f = 1 - (2 * x - 1)
+        return (0.5 * (1 - (f * f * f - f * np.sin(f * pi)))) + 0.5
+
+    return _piecewise(p, lower, upper)
+
+
+# segments of bounce_ease_out, p < 4/11, p < 8/11, p < 9/10 and p <= 1, as
+# the coefficients (a, b, c) of the parabola a * p^2 + b * p + c
+_BOUNCE_THRESHOLDS = np.array([4 / 11.0, 8 / 11.0, 9 / 10.0])
+_BOUNCE_COEFFICIENTS = np.array(
+    [
+        [121 / 16.0, 0.0, 0.0],
+        [363 / 40.0, -99 / 10.0, 17 / 5.0],
+        [4356 / 361.0, -35442 / 1805.0, 16061 / 1805.0],
+        [54 / 5.0, -513 / 25.0, 268 / 25.0],
+    ]
+)
+
+
+def _bounce_ease_out_array(p):
+    # select the parabola of each value instead of branching on it
+    a, b, c = _BOUNCE_COEFFICIENTS[
+        np.searchsorted(_BOUNCE_THRESHOLDS, p, side="right")
+    ].T
+    return (a * p + b) * p + c
+
+
+def _bounce_ease_in_out_array(p):
+    return _piecewise(
+        p,
+        lambda x: 0.5 * (1 - _bounce_ease_out_array(1 - x * 2)),
+        lambda x: 0.5 * _bounce_ease_out_array(x * 2 - 1) + 0.5,
+    )
+
+
+# NumPy implementations of the preset easings, evaluated on whole arrays
+_VECTORIZED_EASING = {
+    Easing.LINEAR: lambda p: p,
+    Easing.QUADRATIC: _quadratic_ease_in_out_array,
+    Easing.CUBIC: _cubic_ease_in_out_array,
+    Easing.QUINTIC: _quintic_ease_in_out_array,
+    Easing.SINE: _sine_ease_in_out_array,
+    Easing.CIRCULAR: _circular_ease_in_out_array,
+    Easing.EXPONENTIAL: _exponential_ease_in_out_array,
+    Easing.ELASTIC: _elastic_ease_in_out_array,
+    Easing.BACK: _back_ease_in_out_array,
+    Easing.BOUNCE: _bounce_ease_in_out_array,
+}
+
+
+def eased_fractions(ease, steps: int) -> np.ndarray:
+    """Eased interpolation fractions for each step of a transition.
+
+    Parameters
+    ----------
+    ease : Easing or callable
+        Easing function mapping `[0, 1]` to `[0, 1]`.
+    steps : int
+        Number of interpolation steps in the transition.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (steps,) holding `ease(s / steps)` for each step `s`.
+    """
+    fractions = np.arange(steps) / steps
+    vectorized = _VECTORIZED_EASING.get(ease)
+    if vectorized is not None:
+        return vectorized(fractions)
+    return np.fromiter(map(ease, fractions.tolist()), float, count=steps)
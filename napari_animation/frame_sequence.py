@@ -1,18 +1,20 @@
 from __future__ import annotations
 
-from collections import deque
-from collections.abc import Iterator, Sequence
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping, Sequence
+from numbers import Integral
 from typing import TYPE_CHECKING
 
 import numpy as np
 from napari.utils.events import EmitterGroup
 
+from .easing import eased_fractions
 from .interpolation import (
     Interpolation,
     InterpolationMap,
-    interpolate_viewer_state,
+    ViewerStateInterpolator,
 )
-from .utils import pairwise
+from .utils import layer_attribute_changed, pairwise, resize_frame
 from .viewer_state import ViewerState
 
 if TYPE_CHECKING:
@@ -21,33 +23,104 @@ if TYPE_CHECKING:
     from .key_frame import KeyFrame, KeyFrameList
 
 
-class LRUDict(dict):
+# number of interpolated states memoized across keyframe index rebuilds
+_STATE_MEMO_SIZE = 256
+# number of upcoming frames of a transition interpolated together
+_INTERPOLATION_BATCH_SIZE = 32
+
+
+class LRUDict(OrderedDict):
+    """Dict keeping only its `cache_size` most recently used items.
+
+    If `cache_size` is None (or not positive), the dict is unbounded.
+    """
+
     def __init__(self, *args, cache_size=None, **kwargs):
         self._cache_size = None
         if cache_size is not None and cache_size > 0:
             self._cache_size = cache_size
-        self._q = deque()
         super().__init__(*args, **kwargs)
 
     def __getitem__(self, key):
         value = super().__getitem__(key)
         if self._cache_size is not None:
             # bring that key back to the top
-            self._q.remove(key)
-            self._q.append(key)
+            self.move_to_end(key)
         return value
 
     def __setitem__(self, key, value):
+        super().__setitem__(key, value)
         if self._cache_size is not None:
-            while len(self) >= self._cache_size:
-                evicted_key = self._q.popleft()
-                super().__delitem__(evicted_key)
-            super().__setitem__(key, value)
-            self._q.append(key)
+            self.move_to_end(key)
+            while len(self) > self._cache_size:
+                self.popitem(last=False)
+
+
+class _KeyFrameIndex(Mapping):
+    """Map of frame number -> (kf0, kf1, fraction), stored as arrays.
+
+    Rather than a tuple per frame, the pairs of keyframes of each transition
+    are stored once, along with the transition and fraction of each frame.
+    """
+
+    def __init__(self):
+        self.clear()
 
     def clear(self):
-        self._q.clear()
-        super().clear()
+        self.set_transitions([], [], [])
+
+    def set_transitions(self, pairs, steps, fractions):
+        """Set the keyframe pairs, frame counts and fractions of transitions."""
+        self._pairs = pairs
+        self._transitions = np.repeat(np.arange(len(pairs)), steps)
+        # first frame of each transition
+        self._starts = np.cumsum(steps) - steps
+        self._fractions = (
+            np.concatenate(fractions) if fractions else np.empty(0)
+        )
+
+    def upcoming_fractions(self, frame: int, n_frames: int) -> list[float]:
+        """Fractions of up to `n_frames` frames of the transition of `frame`,
+        starting at `frame`."""
+        transitions = self._transitions[frame : frame + n_frames]
+        n_frames = np.count_nonzero(transitions == transitions[0])
+        return self._fractions[frame : frame + n_frames].tolist()
+
+    def key_frame_start(self, index: int) -> int:
+        """Frame number of the keyframe at `index` in the KeyFrameList."""
+        if not self._pairs:
+            return 0
+        return int(self._starts[min(index, len(self._pairs) - 1)])
+
+    def __getitem__(self, frame) -> tuple[KeyFrame, KeyFrame, float]:
+        if not isinstance(frame, Integral) or not 0 <= frame < len(self):
+            raise KeyError(frame)
+        kf0, kf1 = self._pairs[self._transitions[frame]]
+        return kf0, kf1, float(self._fractions[frame])
+
+    def __len__(self) -> int:
+        return len(self._fractions)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(len(self)))
+
+
+def _state_key(state: ViewerState):
+    """Key of a viewer state content, or of the state itself if its content
+    can't be hashed."""
+    digest = state._digest
+    return id(state) if digest is None else digest
+
+
+def _is_hold(kf0: KeyFrame, kf1: KeyFrame) -> bool:
+    """Whether the transition between two keyframes leaves the viewer unchanged."""
+    state0, state1 = kf0.viewer_state, kf1.viewer_state
+    if state0 is state1:
+        return True
+    return not any(
+        layer_attribute_changed(getattr(state1, name), getattr(state0, name))
+        for name in ("camera", "dims", "layers")
+    )
 
 
 class FrameSequence(Sequence[ViewerState]):
@@ -57,12 +130,18 @@ class FrameSequence(Sequence[ViewerState]):
     a sequence of (mutable) KeyFrames.  It can be indexed at any (valid) frame
     in the animation, and will inteprolate (and cache) viewer state on demand.
 
-    If the KeyFrameList changes in any way, the cache is cleared.
+    If the KeyFrameList changes in any way, the cache is cleared. Interpolated
+    states are additionally memoized per content of the pair of keyframe
+    states and fraction, so that unchanged transitions are not interpolated
+    again after an edit elsewhere in the KeyFrameList, or when a keyframe is
+    replaced by an identical one.
 
     Parameters
     ----------
     key_frames : KeyFrameList
         A KeyFrameList from which to render the final frame sequence.
+    cache_size : int, optional
+        Number of interpolated viewer states to cache, by default 10.
     """
 
     def __init__(self, key_frames: KeyFrameList, cache_size: int = 10) -> None:
@@ -90,35 +169,107 @@ class FrameSequence(Sequence[ViewerState]):
 
         # cache of interpolated viewer states
         self._cache: dict[int, ViewerState] = LRUDict(cache_size=cache_size)
+        # interpolated viewer states, keyed by the content of the states they
+        # were interpolated from and the fraction, surviving index rebuilds
+        self._state_memo: dict[tuple, tuple] = LRUDict(
+            cache_size=_STATE_MEMO_SIZE
+        )
+        # interpolators of the current transitions, see `_interpolator`
+        self._interpolators: dict[tuple, tuple] = {}
+
+        # the state last applied to the viewer by `iter_frames`
+        self._applied_state = None
 
         # map of frame number -> (kf0, kf1, fraction)
-        self._keyframe_index: dict[int, tuple[KeyFrame, KeyFrame, float]] = {}
+        self._keyframe_index = _KeyFrameIndex()
         self._rebuild_keyframe_index()
 
     def _rebuild_keyframe_index(self, event=None):
         """Create a map of frame number -> (kf0, kf1, fraction)"""
         self._keyframe_index.clear()
         self._cache.clear()
+        self._interpolators.clear()
+        self._prune_state_memo()
 
         n_keyframes = len(self._key_frames)
 
         if n_keyframes == 0:
             self.events.n_frames(value=len(self))
             return
-        elif n_keyframes == 1:
-            f = 0
-            kf1 = self._key_frames[0]
-        else:
-            f = 0
-            for kf0, kf1 in pairwise(self._key_frames):
-                for s in range(kf1.steps):
-                    fraction = kf1.ease(s / kf1.steps)
-                    self._keyframe_index[f] = (kf0, kf1, fraction)
-                    f += 1
-
-        self._keyframe_index[f] = (kf1, kf1, 0)
+
+        pairs, steps, fractions = [], [], []
+        for kf0, kf1 in pairwise(self._key_frames):
+            pairs.append((kf0, kf1))
+            steps.append(kf1.steps)
+            if _is_hold(kf0, kf1):
+                # every frame of the transition is the initial state
+                fractions.append(np.zeros(kf1.steps))
+            else:
+                fractions.append(eased_fractions(kf1.ease, kf1.steps))
+
+        # the last frame is the last keyframe
+        kf1 = self._key_frames[-1]
+        pairs.append((kf1, kf1))
+        steps.append(1)
+        fractions.append(np.zeros(1))
+
+        self._keyframe_index.set_transitions(pairs, steps, fractions)
         self.events.n_frames(value=len(self))
 
+    def _prune_state_memo(self):
+        """Drop memoized states interpolated from states no longer in use."""
+        live_states = {_state_key(kf.viewer_state) for kf in self._key_frames}
+        for memo_key in list(self._state_memo):
+            if not live_states.issuperset(memo_key[:2]):
+                del self._state_memo[memo_key]
+
+    def _memo_key(self, state0, state1, fraction: float) -> tuple:
+        return (
+            _state_key(state0),
+            _state_key(state1),
+            round(fraction * 1e6),
+            tuple(self.state_interpolation_map.items()),
+        )
+
+    def _interpolator(
+        self, state0: ViewerState, state1: ViewerState
+    ) -> ViewerStateInterpolator:
+        """Get a (cached) interpolator between two keyframe states."""
+        map_key = tuple(self.state_interpolation_map.items())
+        key = (id(state0), id(state1), map_key)
+        entry = self._interpolators.get(key)
+        if entry is None:
+            interpolator = ViewerStateInterpolator(
+                state0, state1, self.state_interpolation_map
+            )
+            # keep the states alive with their interpolator so ids stay valid
+            entry = self._interpolators[key] = (state0, state1, interpolator)
+        return entry[-1]
+
+    def _interpolate(self, frame: int) -> ViewerState:
+        """Interpolate (and memoize) the state at `frame`.
+
+        Frames are usually requested in order, so the next frames of the
+        same transition are interpolated (and memoized) in the same batch.
+        """
+        kf0, kf1, fraction = self._keyframe_index[frame]
+        state0, state1 = kf0.viewer_state, kf1.viewer_state
+        memo_key = self._memo_key(state0, state1, fraction)
+        if memo_key in self._state_memo:
+            return self._state_memo[memo_key][-1]
+
+        fractions = self._keyframe_index.upcoming_fractions(
+            frame, _INTERPOLATION_BATCH_SIZE
+        )
+        states = self._interpolator(state0, state1).interpolate_many(fractions)
+        # memoize the furthest frames first, so that they are evicted first
+        for position in reversed(range(len(fractions))):
+            # keep the keyframe states alive so ids used as keys stay valid
+            self._state_memo[
+                self._memo_key(state0, state1, fractions[position])
+            ] = (state0, state1, states[position])
+        return states[0]
+
     def __len__(self) -> int:
         """The total frame count of the animation"""
         return len(self._keyframe_index)
@@ -138,29 +289,49 @@ class FrameSequence(Sequence[ViewerState]):
             if frac == 0:
                 self._cache[key] = kf0.viewer_state
             else:
-                self._cache[key] = interpolate_viewer_state(
-                    kf0.viewer_state,
-                    kf1.viewer_state,
-                    frac,
-                    self.state_interpolation_map,
-                )
+                self._cache[key] = self._interpolate(key)
 
         return self._cache[key]
 
+    def _render_frame(
+        self,
+        state: ViewerState,
+        viewer: napari.viewer.Viewer,
+        canvas_only: bool,
+        scale_factor: float,
+    ) -> np.ndarray:
+        """Render a viewer state."""
+        frame = state.render(
+            viewer, canvas_only=canvas_only, previous_state=self._applied_state
+        )
+        self._applied_state = state
+        # writers expect C-contiguous uint8 data, only copy if needed
+        frame = np.ascontiguousarray(frame, dtype=np.uint8)
+        if scale_factor not in (None, 1):
+            frame = resize_frame(frame, scale_factor)
+        return frame
+
     def iter_frames(
         self,
         viewer: napari.viewer.Viewer,
         canvas_only: bool = True,
         scale_factor: float = None,
     ) -> Iterator[np.ndarray]:
-        """Iterate over interpolated viewer states, and yield rendered frames."""
-        for _i, state in enumerate(self):
-            frame = state.render(viewer, canvas_only=canvas_only)
-            if scale_factor not in (None, 1):
-                from scipy import ndimage as ndi
-
-                frame = ndi.zoom(frame, (scale_factor, scale_factor, 1))
-                frame = frame.astype(np.uint8)
+        """Iterate over interpolated viewer states, and yield rendered frames.
+
+        Consecutive frames sharing the same viewer state (e.g. a transition
+        between two identical keyframes) are only rendered once.
+        """
+        # the state last applied to the viewer while rendering, the layer
+        # attributes are only changed by applying states while rendering
+        self._applied_state = None
+        previous_state = frame = None
+        for state in self:
+            if state is not previous_state:
+                frame = self._render_frame(
+                    state, viewer, canvas_only, scale_factor
+                )
+                previous_state = state
             yield frame
 
     def set_movie_frame_index(self, viewer: napari.viewer.Viewer, index: int):
@@ -1,5 +1,13 @@
 from .interpolation_constants import Interpolation
 from .typing import InterpolationMap
-from .viewer_state_interpolation import interpolate_viewer_state
+from .viewer_state_interpolation import (
+    ViewerStateInterpolator,
+    interpolate_viewer_state,
+)
 
-__all__ = ["Interpolation", "InterpolationMap", "interpolate_viewer_state"]
+__all__ = [
+    "Interpolation",
+    "InterpolationMap",
+    "ViewerStateInterpolator",
+    "interpolate_viewer_state",
+]
@@ -1,12 +1,24 @@
+import math
 from collections.abc import Sequence
 from numbers import Integral, Number, Real
 from typing import TypeVar
 
 import numpy as np
-from scipy.spatial.transform import Rotation as R
 
 _T = TypeVar("_T")
 
+# Coefficients of Eberly's polynomial approximation of slerp, see
+# "A Fast and Accurate Algorithm for Computing SLERP", D. Eberly (2011)
+_SLERP_MU = 1.90110745351730037
+_SLERP_U = np.array(
+    [1 / (i * (2 * i + 1)) for i in range(1, 8)] + [_SLERP_MU / (8 * 17)]
+)
+_SLERP_V = np.array(
+    [i / (2 * i + 1) for i in range(1, 8)] + [_SLERP_MU * 8 / 17]
+)
+# cosine of the angle between quaternions above which slerp falls back to lerp
+_SLERP_LERP_THRESHOLD = 0.9995
+
 
 def default_interpolation(a: _T, b: _T, fraction: float) -> _T:
     """Default interpolation for the corresponding type;
@@ -131,6 +143,10 @@ def interpolate_log(a: float, b: float, fraction: float) -> float:
         : float
     Log interpolated value between a and b at fraction.
     """
+    if a > 0 and b > 0:
+        # math avoids the ufunc overhead of numpy on single numbers
+        log_a = math.log10(a)
+        return 10.0 ** (log_a + (math.log10(b) - log_a) * fraction)
     c = interpolate_num(np.log10(a), np.log10(b), fraction)
     return np.power(10, c)
 
@@ -149,18 +165,136 @@ def slerp(
         initial tuple of Euler angles in degrees.
     b : tuple
         final tuple of Euler angles in degrees.
-    fraction : float
-        fraction to interpolate to between a and b.
+    fraction : float or np.ndarray
+        fraction to interpolate to between a and b. If an array of
+        fractions is given, they are interpolated with `slerp_batch`.
 
     Returns
     ----------
         : tuple
-    Interpolated Euler angles between a and b at fraction.
+    Interpolated Euler angles between a and b at fraction, or an array of
+    shape (len(fraction), 3) for an array of fractions.
     """
-    initial_rotation, final_rotation = R.from_euler(
-        "ZYX", [a, b], degrees=True
+    if np.ndim(fraction) > 0:
+        return slerp_batch(a, b, fraction)
+
+    q0, q1, cos_theta = _slerp_endpoints(a, b)
+    if cos_theta > _SLERP_LERP_THRESHOLD:
+        # sin(theta) vanishes for close rotations, lerp (normalized below)
+        quaternion = q0 + fraction * (q1 - q0)
+    else:
+        theta = math.acos(cos_theta)
+        quaternion = (
+            math.sin((1 - fraction) * theta) * q0
+            + math.sin(fraction * theta) * q1
+        ) / math.sin(theta)
+    return _quaternion_to_euler(*quaternion)
+
+
+def _euler_to_quaternion(z: float, y: float, x: float) -> np.ndarray:
+    """Quaternion (x, y, z, w) of intrinsic "ZYX" Euler angles in degrees,
+    as given by scipy's `Rotation.from_euler(...).as_quat()`."""
+    z, y, x = math.radians(z) / 2, math.radians(y) / 2, math.radians(x) / 2
+    cos_z, sin_z = math.cos(z), math.sin(z)
+    cos_y, sin_y = math.cos(y), math.sin(y)
+    cos_x, sin_x = math.cos(x), math.sin(x)
+    return np.array(
+        [
+            cos_z * cos_y * sin_x - sin_z * sin_y * cos_x,
+            cos_z * sin_y * cos_x + sin_z * cos_y * sin_x,
+            sin_z * cos_y * cos_x - cos_z * sin_y * sin_x,
+            cos_z * cos_y * cos_x + sin_z * sin_y * sin_x,
+        ]
     )
-    rotation_vector = (initial_rotation.inv() * final_rotation).as_rotvec()
-    rotation_vector *= fraction
-    c_rotation = initial_rotation * R.from_rotvec(rotation_vector)
-    return c_rotation.as_euler("ZYX", degrees=True)
+
+
+def _quaternion_to_euler(x: float, y: float, z: float, w: float) -> np.ndarray:
+    """Intrinsic "ZYX" Euler angles in degrees of the (not necessarily unit)
+    quaternion (x, y, z, w), as given by scipy's `Rotation.as_euler`.
+
+    Uses the direct method of Bernardes and Viollet (2022) on scalars,
+    which avoids the overhead of building a `Rotation` for one quaternion.
+    """
+    a, b, c, d = w - y, x + z, y + w, z - x
+    half_sum = math.atan2(b, a)
+    half_diff = math.atan2(d, c)
+    second = 2 * math.atan2(math.hypot(c, d), math.hypot(a, b))
+    if abs(second) <= 1e-7:
+        # gimbal lock, the third angle is set to zero
+        first, third = 0.0, 2 * half_sum
+    elif abs(second - math.pi) <= 1e-7:
+        first, third = 0.0, 2 * half_diff
+    else:
+        first, third = half_sum - half_diff, half_sum + half_diff
+    angles = []
+    for angle in (third, second - math.pi / 2, first):
+        if angle < -math.pi:
+            angle += 2 * math.pi
+        elif angle > math.pi:
+            angle -= 2 * math.pi
+        angles.append(math.degrees(angle))
+    return np.array(angles)
+
+
+def _slerp_coefficients(x: float, t: np.ndarray) -> np.ndarray:
+    """Eberly's polynomial approximation of sin(t * theta) / sin(theta),
+    where x = cos(theta) >= 0."""
+    b = (_SLERP_U * (t * t)[..., np.newaxis] - _SLERP_V) * (x - 1)
+    c = np.ones_like(t)
+    for i in range(len(_SLERP_U) - 1, -1, -1):
+        c = 1 + b[..., i] * c
+    return t * c
+
+
+def _slerp_endpoints(
+    a: tuple[float, float, float],
+    b: tuple[float, float, float],
+) -> tuple[np.ndarray, np.ndarray, float]:
+    """Unit quaternions of Euler angles a and b along the shortest path,
+    and the cosine of the angle between them."""
+    q0, q1 = _euler_to_quaternion(*a), _euler_to_quaternion(*b)
+    cos_theta = np.dot(q0, q1)
+    if cos_theta < 0:
+        # take the shortest path
+        q1, cos_theta = -q1, -cos_theta
+    return q0, q1, min(cos_theta, 1.0)
+
+
+def _slerp_quaternions(
+    q0: np.ndarray, q1: np.ndarray, x: float, fractions: np.ndarray
+) -> np.ndarray:
+    """Quaternions interpolated between the endpoints returned by
+    `_slerp_endpoints` at each of `fractions`."""
+    t = np.asarray(fractions, dtype=np.float64)
+    c0 = _slerp_coefficients(x, 1 - t)
+    c1 = _slerp_coefficients(x, t)
+    return c0[:, np.newaxis] * q0 + c1[:, np.newaxis] * q1
+
+
+def slerp_batch(
+    a: tuple[float, float, float],
+    b: tuple[float, float, float],
+    fractions: np.ndarray,
+) -> np.ndarray:
+    """Compute Spherical linear interpolation from Euler angles at many
+    fractions at once, compatible with the napari view.
+
+    Parameters
+    ----------
+    a : tuple
+        initial tuple of Euler angles in degrees.
+    b : tuple
+        final tuple of Euler angles in degrees.
+    fractions : np.ndarray
+        fractions to interpolate to between a and b.
+
+    Returns
+    ----------
+        : np.ndarray
+    Array of shape (len(fractions), 3) with the interpolated Euler angles
+    between a and b at each fraction.
+    """
+    from scipy.spatial.transform import Rotation as R
+
+    quaternions = _slerp_quaternions(*_slerp_endpoints(a, b), fractions)
+    return R.from_quat(quaternions).as_euler("ZYX", degrees=True)
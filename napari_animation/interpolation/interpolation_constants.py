@@ -25,3 +25,9 @@ class Interpolation(Enum):
 
     def __call__(self, *args):
         return self.value(*args)
+
+    @property
+    def func(self):
+        """The interpolation function itself, to call it without enum
+        dispatch."""
+        return self.value.func
@@ -57,12 +57,37 @@ def keys_to_list(input_dict):
     keys : list
         List of keys pointing to a deep value of the dictionary.
     """
-    for key, value in input_dict.items():
-        if isinstance(value, dict) and value:
-            for sub_key in keys_to_list(value):
-                yield [key] + sub_key
+    for keys, _ in leaves(input_dict):
+        yield keys
+
+
+def leaves(input_dict):
+    """Yield the list of keys and the value of each value deep in a nested
+    dictionary, in a single walk.
+
+    Parameters
+    ----------
+    input_dict : dict
+        Nested dictionary we want to get the deep values from.
+
+    Returns
+    ----------
+    keys, value : list, object
+        List of keys pointing to a deep value of the dictionary, and that
+        value.
+    """
+    # depth-first walk with an explicit stack of (key path, items) rather
+    # than recursive generators, yielding the keys in insertion order
+    stack = [([], iter(input_dict.items()))]
+    while stack:
+        path, items = stack[-1]
+        for key, value in items:
+            if isinstance(value, dict) and value:
+                stack.append(([*path, key], iter(value.items())))
+                break
+            yield [*path, key], value
         else:
-            yield [key]
+            stack.pop()
 
 
 def nested_assert_close(a, b):
@@ -79,13 +104,33 @@ def nested_assert_close(a, b):
         nested_seq_assert_close(a_1, b_1)
 
 
+def _leaf_pairs(a, b):
+    """Yield the pairs of leaves of potentially nested sequences, walking
+    both sequences together like `zip`."""
+    stack = [iter([(a, b)])]
+    while stack:
+        for a_v, b_v in stack[-1]:
+            if isinstance(a_v, (list, tuple)) or isinstance(
+                b_v, (list, tuple)
+            ):
+                stack.append(zip(a_v, b_v))
+                break
+            yield a_v, b_v
+        else:
+            stack.pop()
+
+
 def nested_seq_assert_close(a, b):
     """Assert close to scalar or potentially nested qequences of numeric types and others."""
-    if isinstance(a, (list, tuple)) or isinstance(b, (list, tuple)):
-        for a_v, b_v in zip(a, b):
-            nested_seq_assert_close(a_v, b_v)
-    else:
-        if isinstance(a, Number):
-            np.testing.assert_allclose(a, b)
+    a_numbers, b_numbers = [], []
+    for a_v, b_v in _leaf_pairs(a, b):
+        if isinstance(a_v, Number):
+            a_numbers.append(a_v)
+            b_numbers.append(b_v)
         else:
-            assert a == b
+            assert a_v == b_v
+    # a single comparison for all the numeric leaves
+    np.testing.assert_allclose(
+        np.array(a_numbers, dtype=np.float64),
+        np.array(b_numbers, dtype=np.float64),
+    )
@@ -1,10 +1,336 @@
-from dataclasses import asdict
+from numbers import Integral, Number, Real
 from typing import Optional
 
+import numpy as np
+
+from ..utils import layer_attribute_changed
 from ..viewer_state import ViewerState
+from .base_interpolation import _slerp_endpoints, _slerp_quaternions
 from .interpolation_constants import Interpolation
 from .typing import InterpolationMap
-from .utils import keys_to_list, nested_get, nested_set
+from .utils import nested_get
+
+
+def _is_number(value) -> bool:
+    """Whether value is a real, non-boolean number."""
+    return isinstance(value, Real) and not isinstance(value, bool)
+
+
+def _number_type(a, b) -> type:
+    """Type of the linear interpolation between numbers a and b."""
+    if isinstance(b, Real) and isinstance(a, Integral):
+        return type(b)
+    return type(a)
+
+
+def _is_number_tree(a, b) -> bool:
+    """Whether a and b are numbers, or sequences of the same length whose
+    items are number trees."""
+    if _is_number(a) and _is_number(b):
+        return True
+    return (
+        isinstance(a, (list, tuple))
+        and isinstance(b, (list, tuple))
+        and len(a) == len(b)
+        and all(map(_is_number_tree, a, b))
+    )
+
+
+def _number_tree_template(a, b, numbers_a: list, numbers_b: list):
+    """Template of the number trees a and b, and append their numbers to
+    numbers_a and numbers_b in the order they are read by
+    `_build_number_tree`."""
+    if _is_number(a) and _is_number(b):
+        numbers_a.append(a)
+        numbers_b.append(b)
+        return _number_type(a, b)
+    return (
+        type(a),
+        [
+            _number_tree_template(x, y, numbers_a, numbers_b)
+            for x, y in zip(a, b)
+        ],
+    )
+
+
+def _build_number_tree(template, numbers):
+    """Build a number tree from its template and an iterator of numbers."""
+    if isinstance(template, tuple):
+        seq_cls, children = template
+        return _make_sequence(
+            seq_cls, [_build_number_tree(c, numbers) for c in children]
+        )
+    return template(next(numbers))
+
+
+def _is_static(a, b) -> bool:
+    """Whether the default interpolation of a and b is a at any fraction,
+    i.e. a and b are equal values of the same types."""
+    if a is b:
+        return True
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(map(_is_static, a, b))
+    if _is_number(a):
+        return a == b
+    return not layer_attribute_changed(a, b)
+
+
+def _switches_from_start(a, b) -> bool:
+    """Whether the default interpolation of a and b is an instantaneous
+    transition, as for booleans, strings or arrays."""
+    if isinstance(a, bool) or isinstance(b, bool):
+        return True
+    return not (isinstance(a, Number) and isinstance(b, Number)) and not (
+        isinstance(a, (list, tuple)) and isinstance(b, (list, tuple))
+    )
+
+
+def _function_of(interpolation):
+    """The function to call for an interpolation, unwrapping Interpolation
+    members once rather than dispatching through the enum on each call."""
+    if isinstance(interpolation, Interpolation):
+        return interpolation.func
+    return interpolation
+
+
+def _make_sequence(seq_cls, items):
+    """Build a sequence of type seq_cls from a list of items."""
+    try:
+        return seq_cls(items)
+    except TypeError:
+        # some interables, like NamedTuple, want the arguments separately
+        return seq_cls(*items)
+
+
+class ViewerStateInterpolator:
+    """Interpolate between two viewer states at arbitrary fractions.
+
+    The leaves of both states are walked and classified once. Numeric
+    leaves (numbers and sequences of numbers, possibly nested) using the
+    default interpolation are packed into arrays, so that they can be
+    interpolated for any number of fractions with a single NumPy
+    expression. Leaves using SLERP are interpolated for all fractions in
+    one batch, from endpoint quaternions computed once, and so are positive
+    numbers using LOG, linearly in log space. Leaves whose default
+    interpolation is an instantaneous transition (booleans, strings,
+    arrays...) just switch values, and all other leaves are interpolated
+    with their interpolation function. Leaves using the default
+    interpolation or SLERP which are equal in both states are not
+    interpolated at all, and if both states have the same leaves, they are
+    returned as they are at fractions 0 and 1.
+
+    Parameters
+    ----------
+    initial_state : ViewerState
+        Description of initial viewer state.
+    final_state : ViewerState
+        Description of final viewer state.
+    interpolation_map : InterpolationMap or None
+        Dictionary mapping state attribute keys to interpolation functions.
+    """
+
+    def __init__(
+        self,
+        initial_state: ViewerState,
+        final_state: ViewerState,
+        interpolation_map: Optional[InterpolationMap] = None,
+    ):
+        self._keys = initial_state._leaf_keys
+        initial_values = [value for _, value in initial_state._leaves]
+        if final_state._leaf_keys == self._keys:
+            # same layout, e.g. no layer was added or removed
+            final_values = [value for _, value in final_state._leaves]
+            # the states themselves are returned at fractions 0 and 1
+            self._endpoints = (initial_state, final_state)
+        else:
+            final_dict = final_state._state_dict
+            final_values = [
+                nested_get(final_dict, keys) for keys in self._keys
+            ]
+            self._endpoints = None
+        # values of the interpolated states, set for static leaves only
+        self._static_values = [None] * len(self._keys)
+        # (leaf index, array position, number type)
+        self._scalars = []
+        # (leaf index, array start, array stop, sequence type, number types)
+        self._sequences = []
+        # (leaf index, array start, array stop, template) of nested sequences
+        self._trees = []
+        # (leaf index, v0, v1) of leaves switching from v0 to v1
+        self._switches = []
+        # (leaf index, q0, q1, cos theta) of leaves using SLERP
+        self._slerps = []
+        # (leaf index, log array position) of leaves using LOG
+        self._logs = []
+        # (leaf index, interpolation function, v0, v1)
+        self._others = []
+
+        a, b = [], []
+        log_a, log_b = [], []
+        names = initial_state._leaf_names if interpolation_map else None
+        for index, (v0, v1) in enumerate(zip(initial_values, final_values)):
+            if names is not None and names[index] is not None:
+                interpolation_function = interpolation_map.get(
+                    names[index], Interpolation.DEFAULT
+                )
+            else:
+                interpolation_function = Interpolation.DEFAULT
+
+            if (
+                interpolation_function is Interpolation.DEFAULT
+                or interpolation_function is Interpolation.SLERP
+            ) and _is_static(v0, v1):
+                # e.g. layer attributes which are the same in both states, or
+                # the angles of a camera which only pans or zooms
+                self._static_values[index] = v0
+            elif interpolation_function is Interpolation.SLERP:
+                self._slerps.append((index, *_slerp_endpoints(v0, v1)))
+            elif (
+                interpolation_function is Interpolation.LOG
+                and _is_number(v0)
+                and _is_number(v1)
+                and v0 > 0
+                and v1 > 0
+            ):
+                self._logs.append((index, len(log_a)))
+                log_a.append(v0)
+                log_b.append(v1)
+            elif interpolation_function is not Interpolation.DEFAULT:
+                self._others.append(
+                    (index, _function_of(interpolation_function), v0, v1)
+                )
+            elif _is_number(v0) and _is_number(v1):
+                self._scalars.append((index, len(a), _number_type(v0, v1)))
+                a.append(v0)
+                b.append(v1)
+            elif (
+                isinstance(v0, (list, tuple))
+                and isinstance(v1, (list, tuple))
+                and len(v0) == len(v1)
+                and all(map(_is_number, v0))
+                and all(map(_is_number, v1))
+            ):
+                number_types = tuple(map(_number_type, v0, v1))
+                start = len(a)
+                a.extend(v0)
+                b.extend(v1)
+                self._sequences.append(
+                    (index, start, len(a), type(v0), number_types)
+                )
+            elif _is_number_tree(v0, v1):
+                start = len(a)
+                template = _number_tree_template(v0, v1, a, b)
+                self._trees.append((index, start, len(a), template))
+            elif _switches_from_start(v0, v1):
+                self._switches.append((index, v0, v1))
+            else:
+                self._others.append(
+                    (index, _function_of(interpolation_function), v0, v1)
+                )
+
+        self._a = np.array(a, dtype=np.float64)
+        self._delta = np.array(b, dtype=np.float64) - self._a
+        self._log_a = np.log(np.array(log_a, dtype=np.float64))
+        self._log_delta = (
+            np.log(np.array(log_b, dtype=np.float64)) - self._log_a
+        )
+
+        # The nested dicts of the interpolated states always have the same
+        # layout. Record it once as assignments `objects[parent][key] =
+        # objects[child]`, where objects are the leaf values followed by the
+        # nested dicts, so that states are built without walking key paths.
+        n_leaves = len(self._keys)
+        self._root = n_leaves
+        self._assignments = []
+        dict_indices = {(): self._root}
+        for index, keys in enumerate(self._keys):
+            parent = self._root
+            for depth in range(1, len(keys)):
+                path = tuple(keys[:depth])
+                if path not in dict_indices:
+                    dict_indices[path] = n_leaves + len(dict_indices)
+                    self._assignments.append(
+                        (parent, keys[depth - 1], dict_indices[path])
+                    )
+                parent = dict_indices[path]
+            self._assignments.append((parent, keys[-1], index))
+        self._n_dicts = len(dict_indices)
+
+    def __call__(self, fraction: float) -> ViewerState:
+        """Interpolate a single state at `fraction`."""
+        return self.interpolate_many([fraction])[0]
+
+    def interpolate_many(self, fractions) -> list[ViewerState]:
+        """Interpolate states at each of `fractions`.
+
+        Parameters
+        ----------
+        fractions : sequence of float
+            Interpolation fractions, each between `0` and `1`.
+
+        Returns
+        -------
+        states : list of ViewerState
+            One interpolated state per fraction.
+        """
+        fractions = list(fractions)
+        column = np.array(fractions, dtype=np.float64)[:, np.newaxis]
+        # numeric leaves of every frame at once, shape (n_frames, n_numbers)
+        tracks = self._a + self._delta * column
+        log_tracks = np.exp(self._log_a + self._log_delta * column)
+        angles = []
+        if self._slerps:
+            from scipy.spatial.transform import Rotation as R
+
+            # convert the quaternions of all SLERP leaves in a single call
+            quaternions = np.concatenate(
+                [
+                    _slerp_quaternions(q0, q1, x, column[:, 0])
+                    for _, q0, q1, x in self._slerps
+                ]
+            )
+            eulers = R.from_quat(quaternions).as_euler("ZYX", degrees=True)
+            n_frames = len(fractions)
+            angles = [
+                (index, eulers[i * n_frames : (i + 1) * n_frames])
+                for i, (index, *_) in enumerate(self._slerps)
+            ]
+
+        states = []
+        for frame, (row, fraction) in enumerate(
+            zip(tracks.tolist(), fractions)
+        ):
+            if self._endpoints is not None and fraction in (0.0, 1.0):
+                states.append(self._endpoints[int(fraction)])
+                continue
+            values = self._static_values.copy()
+            for index, leaf_angles in angles:
+                values[index] = leaf_angles[frame]
+            for index, position in self._logs:
+                values[index] = log_tracks[frame, position]
+            for index, position, number_type in self._scalars:
+                values[index] = number_type(row[position])
+            for index, start, stop, seq_cls, number_types in self._sequences:
+                values[index] = _make_sequence(
+                    seq_cls,
+                    [t(v) for t, v in zip(number_types, row[start:stop])],
+                )
+            for index, start, stop, template in self._trees:
+                values[index] = _build_number_tree(
+                    template, iter(row[start:stop])
+                )
+            for index, v0, v1 in self._switches:
+                values[index] = v1 if fraction > 0.0 else v0
+            for index, function, v0, v1 in self._others:
+                values[index] = function(v0, v1, fraction)
+
+            objects = values + [{} for _ in range(self._n_dicts)]
+            for parent, key, child in self._assignments:
+                objects[parent][key] = objects[child]
+            states.append(ViewerState(**objects[self._root]))
+        return states
 
 
 def interpolate_viewer_state(
@@ -21,38 +347,23 @@ def interpolate_viewer_state(
         Description of initial viewer state.
     final_state : ViewerState
         Description of final viewer state.
-    fraction : float
+    fraction : float or sequence of float
         Interpolation fraction, must be between `0` and `1`.
         A value of `0` will return the initial state. A
-        value of `1` will return the final state.
+        value of `1` will return the final state. If a sequence of
+        fractions is given, the states are interpolated in one batch.
     interpolation_map : InterpolationMap or None
         Dictionary mapping state attribute keys to interpolation functions.
 
     Returns
     -------
-    state : dict
-        Description of viewer state.
+    state : ViewerState or list of ViewerState
+        Interpolated viewer state, or a list of states if a sequence of
+        fractions was given.
     """
-
-    viewer_state_data = {}
-
-    initial_state = asdict(initial_state)
-    final_state = asdict(final_state)
-
-    for keys in keys_to_list(initial_state):
-        v0 = nested_get(initial_state, keys)
-        v1 = nested_get(final_state, keys)
-
-        all_keys_are_strings = all(isinstance(key, str) for key in keys)
-        if interpolation_map is not None and all_keys_are_strings:
-            attribute_name = ".".join(keys)
-            interpolation_function = interpolation_map.get(
-                attribute_name, Interpolation.DEFAULT
-            )
-        else:
-            interpolation_function = Interpolation.DEFAULT
-        interpolated_value = interpolation_function(v0, v1, fraction)
-
-        nested_set(viewer_state_data, keys, interpolated_value)
-
-    return ViewerState(**viewer_state_data)
+    interpolator = ViewerStateInterpolator(
+        initial_state, final_state, interpolation_map
+    )
+    if np.ndim(fraction) == 0:
+        return interpolator(fraction)
+    return interpolator.interpolate_many(fraction)
@@ -65,16 +65,9 @@ class KeyFrame:
         return id(self)
 
     def __eq__(self, other):
-        if isinstance(other, KeyFrame):
-            return (
-                self.__hash__() == other.__hash__()
-                and self.viewer_state == other.viewer_state
-                and (self.thumbnail == other.thumbnail).all()
-                and self.steps == other.steps
-                and self.ease == other.ease
-            )
-        else:
-            return False
+        # keyframes hash by identity, so a keyframe is only equal to itself,
+        # and comparing its fields (e.g. the thumbnail pixels) is not needed
+        return self is other
 
 
 class KeyFrameList(SelectableEventedList[KeyFrame]):
@@ -1,40 +1,79 @@
 import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
+# types whose values are compared with == by layer_attribute_changed
+_PRIMITIVE_TYPES = (bool, int, float, str, type(None))
+# number of elements of arrays compared at once by layer_attribute_changed
+_ARRAY_COMPARE_CHUNK = 2**16
+
 
 def make_thumbnail(image: np.ndarray, shape=(30, 30, 4)) -> np.ndarray:
     """Resizes an image to `shape` with padding"""
     from napari.layers.utils.layer_utils import convert_to_uint8
-    from scipy import ndimage as ndi
 
     scale_factor = np.min(np.divide(shape, image.shape))
-    intermediate_image = ndi.zoom(image, (scale_factor, scale_factor, 1))
+    intermediate_image = resize_frame(convert_to_uint8(image), scale_factor)
 
     padding_needed = np.subtract(shape, intermediate_image.shape)
     pad_amounts = [(p // 2, (p + 1) // 2) for p in padding_needed]
     thumbnail = np.pad(intermediate_image, pad_amounts, mode="constant")
-    thumbnail = convert_to_uint8(thumbnail)
 
-    # blend thumbnail with opaque black background
-    background = np.zeros(shape, dtype=np.uint8)
-    background[..., 3] = 255
+    # blend thumbnail with opaque black background, in 16-bit integers as
+    # 255 * 255 fits: rgb * alpha / 255, alpha * alpha / 255 + 255 - alpha
+    alpha = thumbnail[..., 3:].astype(np.uint16)
+    blended = thumbnail * alpha
+    blended[..., 3] += 255 * (255 - alpha[..., 0])
+    blended //= 255
+    return blended.astype(np.uint8)
+
+
+def resize_frame(frame: np.ndarray, scale_factor: float) -> np.ndarray:
+    """Rescale a uint8 (h, w, c) frame by `scale_factor`.
+
+    Downscaling averages the pixels covered by each output pixel, upscaling
+    interpolates bilinearly. The output shape is rounded like `ndi.zoom`.
+    """
+    from PIL import Image
 
-    f_dest = thumbnail[..., 3][..., None] / 255
-    f_source = 1 - f_dest
-    thumbnail = thumbnail * f_dest + background * f_source
-    return thumbnail.astype(np.uint8)
+    height, width = frame.shape[:2]
+    size = (round(width * scale_factor), round(height * scale_factor))
+    resample = Image.BOX if scale_factor < 1 else Image.BILINEAR
+    return np.array(Image.fromarray(frame).resize(size, resample))
 
 
-def pairwise(iterable):
-    "s -> (s0,s1), (s1,s2), (s2, s3), ..."
-    a, b = itertools.tee(iterable)
-    next(b, None)
-    return zip(a, b)
+try:
+    from itertools import pairwise
+except ImportError:  # python < 3.10
+
+    def pairwise(iterable):
+        "s -> (s0,s1), (s1,s2), (s2, s3), ..."
+        a, b = itertools.tee(iterable)
+        next(b, None)
+        return zip(a, b)
 
 
 def layer_attribute_changed(value, original_value):
     """Recursively check if a layer attribute has changed."""
+    if value is original_value:
+        return False
+    if type(value) is type(original_value) and type(value) in _PRIMITIVE_TYPES:
+        # np.array_equal would first convert both values to arrays
+        return value != original_value
+    if (
+        type(value) is type(original_value)
+        and type(value) in (list, tuple)
+        and all(type(v) in _PRIMITIVE_TYPES for v in value)
+        and all(type(v) in _PRIMITIVE_TYPES for v in original_value)
+    ):
+        # e.g. scale, translate or contrast_limits
+        return value != original_value
+    if isinstance(value, np.ndarray) and isinstance(
+        original_value, np.ndarray
+    ):
+        return not _arrays_equal(value, original_value)
     if isinstance(value, dict):
         if (
             not isinstance(original_value, dict)
@@ -46,3 +85,61 @@ def layer_attribute_changed(value, original_value):
             for key in value
         )
     return not np.array_equal(value, original_value)
+
+
+def _arrays_equal(a: np.ndarray, b: np.ndarray) -> bool:
+    """Same as `np.array_equal`, but large arrays are compared in chunks of
+    rows, stopping at the first chunk with a difference."""
+    if a.shape != b.shape:
+        return False
+    if a.size <= _ARRAY_COMPARE_CHUNK:
+        return bool(np.asarray(a == b).all())
+    rows = max(1, _ARRAY_COMPARE_CHUNK * len(a) // a.size)
+    return all(
+        np.asarray(a[i : i + rows] == b[i : i + rows]).all()
+        for i in range(0, len(a), rows)
+    )
+
+
+def write_frames(frames, write, max_workers=1, max_pending=4, on_written=None):
+    """Write frames in background threads while the next ones are produced.
+
+    Frames are produced (e.g. rendered) by iterating over `frames` in the
+    calling thread, and handed to `write` in a pool of worker threads. At
+    most `max_pending` frames wait to be written, bounding memory usage.
+
+    Parameters
+    ----------
+    frames : iterable of np.ndarray
+        Frames to write.
+    write : callable
+        Called as `write(frame_index, frame)` for each frame. With a single
+        worker, frames are written in order.
+    max_workers : int
+        Number of writer threads, by default 1.
+    max_pending : int
+        Maximum number of frames waiting to be written, by default 4.
+    on_written : callable, optional
+        Called without arguments in the calling thread once per written
+        frame, e.g. to update a progress bar.
+    """
+    pending = deque()
+
+    def wait_oldest():
+        # raises any error of the writer
+        pending.popleft().result()
+        if on_written is not None:
+            on_written()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for frame_index, frame in enumerate(frames):
+                if len(pending) >= max_pending:
+                    wait_oldest()
+                pending.append(executor.submit(write, frame_index, frame))
+            while pending:
+                wait_oldest()
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
@@ -1,5 +1,8 @@
 import contextlib
-from dataclasses import dataclass
+import hashlib
+import pickle
+from dataclasses import dataclass, fields
+from functools import cached_property
 
 import napari
 import numpy as np
@@ -7,6 +10,20 @@ import numpy as np
 from napari_animation.utils import layer_attribute_changed
 
 
+def _changed_items(values: dict, previous_values: dict) -> dict:
+    """Items of `values` which are missing from or differ in
+    `previous_values`."""
+    return {
+        key: value
+        for key, value in values.items()
+        if key not in previous_values
+        or (
+            value is not previous_values[key]
+            and layer_attribute_changed(value, previous_values[key])
+        )
+    }
+
+
 @dataclass(frozen=True)
 class ViewerState:
     """The state of the viewer camera, dims, and layers.
@@ -20,6 +37,13 @@ class ViewerState:
     layers : dict
         A map of layer.name -> Dict[k, v] for layer attributes for each layer in the viewer
         (excluding metadata).
+
+    Notes
+    -----
+    The camera, dims and layers dicts must not be modified in place: data
+    derived from them, such as the content digest and leaves of the state,
+    is cached, and so are states interpolated from them. Use
+    `dataclasses.replace` to get a modified state instead.
     """
 
     camera: dict
@@ -29,42 +53,128 @@ class ViewerState:
     @classmethod
     def from_viewer(cls, viewer: napari.viewer.Viewer):
         """Create a ViewerState from a viewer instance."""
+        # copy the layer attributes in one pass, leaving out the metadata
         layers = {
-            layer.name: dict(layer.as_layer_data_tuple()[1])
+            layer.name: {
+                name: value
+                for name, value in layer.as_layer_data_tuple()[1].items()
+                if name != "metadata"
+            }
             for layer in viewer.layers
         }
-        for layer_attributes in layers.values():
-            layer_attributes.pop("metadata")
 
         return cls(
             camera=viewer.camera.dict(), dims=viewer.dims.dict(), layers=layers
         )
 
-    def apply(self, viewer: napari.viewer.Viewer):
+    @cached_property
+    def _state_dict(self) -> dict:
+        """This state as a nested dict, for reading only.
+
+        Unlike `dataclasses.asdict`, the nested dicts and values are not
+        copied but shared with this state.
+        """
+        return {
+            "camera": self.camera,
+            "dims": self.dims,
+            "layers": self.layers,
+        }
+
+    @cached_property
+    def _leaves(self) -> list:
+        """(key path, value) of every leaf value in `_state_dict`."""
+        from .interpolation.utils import leaves
+
+        return list(leaves(self._state_dict))
+
+    @cached_property
+    def _leaf_keys(self) -> list:
+        """Key paths of every leaf value in `_state_dict`."""
+        return [keys for keys, _ in self._leaves]
+
+    @cached_property
+    def _leaf_names(self) -> list:
+        """Dotted names of the leaves in `_leaf_keys`, as used in an
+        InterpolationMap, or None for leaves with non-string keys."""
+        return [
+            ".".join(keys) if all(isinstance(k, str) for k in keys) else None
+            for keys in self._leaf_keys
+        ]
+
+    @cached_property
+    def _digest(self):
+        """Digest of the state content, or None if it can't be serialized."""
+        try:
+            data = pickle.dumps(self._state_dict, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return None
+        return hashlib.blake2b(data, digest_size=16).digest()
+
+    def apply(
+        self,
+        viewer: napari.viewer.Viewer,
+        previous_state: "ViewerState" = None,
+    ):
         """Update `viewer` to match this ViewerState.
 
         Parameters
         ----------
         viewer : napari.viewer.Viewer
             A napari viewer. (viewer state will be directly modified)
+        previous_state : ViewerState, optional
+            The state last applied to `viewer`, if its layer attributes were
+            only changed by applying states since. Layer attributes that have
+            the same value in both states are then not set again.
+
+        Notes
+        -----
+        Camera and dims values are compared with those of the viewer rather
+        than with `previous_state`, as napari changes them as a side effect
+        of other changes, e.g. switching `dims.ndisplay` resets the camera
+        and layer transforms change `dims.range`.
         """
+        # every field updated is validated, even if it is unchanged
+        camera = _changed_items(self.camera, viewer.camera.dict())
+        dims = _changed_items(self.dims, viewer.dims.dict())
+        previous_layers = (
+            {} if previous_state is None else previous_state.layers
+        )
+        if camera:
+            viewer.camera.update(camera)
+        if dims:
+            viewer.dims.update(dims)
 
-        viewer.camera.update(self.camera)
-        viewer.dims.update(self.dims)
-
+        # LayerList lookups by name scan the list, so build the map once
+        layers_by_name = {layer.name: layer for layer in viewer.layers}
         for layer_name, layer_state in self.layers.items():
-            layer = viewer.layers[layer_name]
-            layer_attributes = layer.as_layer_data_tuple()[1]
+            previous_layer_state = previous_layers.get(layer_name, {})
+            layer = layers_by_name[layer_name]
+            layer_attributes = None
             for attribute_name, value in layer_state.items():
-                original_value = layer_attributes[attribute_name]
-                # Only setattr if value has changed to avoid expensive redraws
-                # dicts can hold arrays, e.g. `color`, requiring comparisons of key/value pairs
-                if layer_attribute_changed(value, original_value):
-                    with contextlib.suppress(AttributeError):
-                        setattr(layer, attribute_name, value)
+                if attribute_name in previous_layer_state:
+                    previous_value = previous_layer_state[attribute_name]
+                    if value is previous_value or not layer_attribute_changed(
+                        value, previous_value
+                    ):
+                        continue
+                    # the layer still has the previous value, which differs
+                else:
+                    if layer_attributes is None:
+                        # only get the layer state if an attribute is unknown
+                        layer_attributes = layer.as_layer_data_tuple()[1]
+                    original_value = layer_attributes[attribute_name]
+                    # Only setattr if value has changed to avoid expensive redraws
+                    # dicts can hold arrays, e.g. `color`, requiring comparisons of key/value pairs
+                    if not layer_attribute_changed(value, original_value):
+                        continue
+                with contextlib.suppress(AttributeError):
+                    setattr(layer, attribute_name, value)
 
     def render(
-        self, viewer: napari.viewer.Viewer, canvas_only: bool = True
+        self,
+        viewer: napari.viewer.Viewer,
+        canvas_only: bool = True,
+        previous_state: "ViewerState" = None,
     ) -> np.ndarray:
         """Render this ViewerState to an image.
 
@@ -75,16 +185,32 @@ class ViewerState:
         canvas_only : bool, optional
             Whether to include only the canvas (and exclude the napari
             gui), by default True
+        previous_state : ViewerState, optional
+            The state last applied to `viewer`, see `ViewerState.apply`.
 
         Returns
         -------
         np.ndarray
             An RGBA image of shape (h, w, 4).
         """
-        self.apply(viewer)
+        self.apply(viewer, previous_state=previous_state)
         return viewer.screenshot(canvas_only=canvas_only, flash=False)
 
+    def __getstate__(self):
+        # only the fields, the cached properties are recomputed on demand
+        return tuple(getattr(self, field.name) for field in fields(self))
+
+    def __setstate__(self, state):
+        if isinstance(state, dict):
+            # instance dict, as pickled before `__getstate__` was defined
+            state = tuple(state[field.name] for field in fields(self))
+        for field, value in zip(fields(self), state):
+            object.__setattr__(self, field.name, value)
+
     def __eq__(self, other):
+        if self is other:
+            # states are frozen, skip comparing a state with itself
+            return True
         if isinstance(other, ViewerState):
             return (
                 self.camera == other.camera